@@ -5,12 +5,31 @@ import { GoogleGenerativeAIEmbeddings } from "@langchain/google-genai";
 import { Pinecone } from "@pinecone-database/pinecone";
 import { PineconeStore } from "@langchain/community/vectorstores/pinecone";
 import { Document } from "@langchain/core/documents";
+import { RecursiveCharacterTextSplitter } from "langchain/text_splitter";
 
 const apikey = process.env.GOOGLE_API_KEY;
 
+// hard deadlines, not just socket idle time
+const SCRAPE_TIMEOUT_MS = 15000;
+const API_TIMEOUT_MS = 30000;
+
+// Reject if the promise hasn't settled within ms
+function withTimeout(promise, ms, label) {
+  let timer;
+  const timeout = new Promise((_, reject) => {
+    timer = setTimeout(
+      () => reject(new Error(`${label} timed out after ${ms} ms`)),
+      ms,
+    );
+  });
+  return Promise.race([promise, timeout]).finally(() => clearTimeout(timer));
+}
+
 // Scrape webpage
 async function scrapeWebPage(url) {
-  const { data: html } = await axios.get(url);
+  const { data: html } = await axios.get(url, {
+    signal: AbortSignal.timeout(SCRAPE_TIMEOUT_MS),
+  });
   const $ = cheerio.load(html);
   const text = $("body").text().replace(/\s+/g, " ").trim();
   return text.slice(0, 5000); // truncate for testing
@@ -29,22 +48,53 @@ const pinecone = new Pinecone({
 
 const index = pinecone.Index("activity");
 
+// vector store, built once and reused for every page
+const vectorStore = await PineconeStore.fromExistingIndex(embeddings, {
+  pineconeIndex: index,
+  namespace: "bihar",
+});
+
+// Split pages into chunks so each one gets its own embedding
+const splitter = new RecursiveCharacterTextSplitter({
+  chunkSize: 1000,
+  chunkOverlap: 100,
+});
+
 // Main function
 async function processAndStore(url) {
   const content = await scrapeWebPage(url);
-  const docs = [
+  const docs = await splitter.splitDocuments([
     new Document({ pageContent: content, metadata: { source: url } }),
-  ];
+  ]);
 
-  // Store in Pinecone
-  await PineconeStore.fromDocuments(docs, embeddings, {
-    pineconeIndex: index,
-    namespace: "bihar",
-  });
+  // embedDocuments drops failed batches instead of throwing
+  const vectors = await withTimeout(
+    embeddings.embedDocuments(docs.map((doc) => doc.pageContent)),
+    API_TIMEOUT_MS,
+    "Embedding",
+  );
+  if (vectors.length !== docs.length) {
+    throw new Error(
+      `Embedded ${vectors.length} of ${docs.length} chunks from ${url}`,
+    );
+  }
+
+  // Store in Pinecone, with stable ids so re-running overwrites chunks
+  await withTimeout(
+    vectorStore.addVectors(vectors, docs, {
+      ids: docs.map((_, i) => `${url}#${i}`),
+    }),
+    API_TIMEOUT_MS,
+    "Pinecone upsert",
+  );
 
   console.log("✅ Data stored in Pinecone!");
 }
 
+// exit explicitly so a timed-out request can't keep the process alive
 processAndStore("https://en.wikipedia.org/wiki/Bihari_culture").catch(
-  console.error,
+  (err) => {
+    console.error(err);
+    process.exit(1);
+  },
 );